@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Division, Team, Fixture, Player, Goal
+from .models import Season, Division, Team, Fixture, Player, Goal, ArchivedFixture, ArchivedGoal
 
 # This is a class that defines how to show Goal entries inside another model's admin page
 class GoalInline(admin.TabularInline):
@@ -18,11 +18,33 @@ class PlayerAdmin(admin.ModelAdmin):
 
 @admin.register(Fixture)
 class FixtureAdmin(admin.ModelAdmin):
-    list_display = ('match_date', 'home_team', 'away_team', 'division')
-    list_filter = ('match_date', 'division')
+    list_display = ('match_date', 'home_team', 'away_team', 'division', 'season')
+    list_filter = ('season', 'match_date', 'division')
+    # Season follows match_date; show it but don't let it be picked by hand
+    readonly_fields = ('season',)
     # This is the key part: it adds the Goal entry form to the Fixture page
     inlines = [GoalInline]
 
+@admin.register(Season)
+class SeasonAdmin(admin.ModelAdmin):
+    list_display = ('name', 'start_date', 'end_date', 'archived')
+    # Archiving is done by the archive_seasons command, not by ticking a box
+    readonly_fields = ('archived',)
+    # Deleting a season would take its fixtures or archive with it
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+class ArchivedGoalInline(admin.TabularInline):
+    model = ArchivedGoal
+    autocomplete_fields = ['player']
+    extra = 0
+
+@admin.register(ArchivedFixture)
+class ArchivedFixtureAdmin(admin.ModelAdmin):
+    list_display = ('match_date', 'home_team_name', 'away_team_name', 'division_name', 'season')
+    list_filter = ('season', 'division_name')
+    inlines = [ArchivedGoalInline]
+
 # We can keep these simple registrations for basic management
 admin.site.register(Division)
 admin.site.register(Team)
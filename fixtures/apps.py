@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class FixturesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'fixtures'
+
+    def ready(self):
+        from . import signals  # noqa: F401 - registers the republish receivers
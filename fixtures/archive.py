@@ -0,0 +1,54 @@
+from datetime import date
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Season, Fixture, Goal, ArchivedFixture, ArchivedGoal
+from .publish import publishing_paused
+
+
+def finished_seasons(today: date = None):
+    """Seasons that have ended and still have their data in the live tables."""
+    today = today or timezone.localdate()
+    return Season.objects.filter(end_date__lt=today, archived=False).order_by('start_date')
+
+
+@transaction.atomic
+def archive_season(season: Season) -> tuple[int, int]:
+    """Move a season's fixtures and goals into the archive tables.
+
+    Returns (fixtures archived, goals archived). Runs in one transaction, so a
+    failure part way leaves the live tables untouched."""
+    fixtures = list(
+        Fixture.all_seasons.filter(season=season).select_related('division', 'home_team', 'away_team')
+    )
+    archived = ArchivedFixture.objects.bulk_create([
+        ArchivedFixture(
+            season=season,
+            division_name=fixture.division.name,
+            home_team_name=fixture.home_team.name,
+            away_team_name=fixture.away_team.name,
+            match_date=fixture.match_date,
+            home_score=fixture.home_score,
+            away_score=fixture.away_score,
+            decision=fixture.decision,
+            scorers_text=fixture.scorers_text,
+        )
+        for fixture in fixtures
+    ], batch_size=500)
+    # bulk_create keeps order, so we can pair each live fixture with its archived copy
+    archived_ids = {fixture.id: copy.id for fixture, copy in zip(fixtures, archived)}
+
+    goals = Goal.all_seasons.filter(fixture__season=season).values_list('fixture_id', 'player_id', 'quantity')
+    archived_goals = ArchivedGoal.objects.bulk_create([
+        ArchivedGoal(fixture_id=archived_ids[fixture_id], player_id=player_id, quantity=quantity)
+        for fixture_id, player_id, quantity in goals
+    ], batch_size=500)
+
+    # Goals go with their fixtures via CASCADE. Old seasons aren't on the public
+    # pages, so there's nothing to republish for these deletes.
+    with publishing_paused():
+        Fixture.all_seasons.filter(season=season).delete()
+    season.archived = True
+    season.save(update_fields=['archived'])
+    return len(archived), len(archived_goals)
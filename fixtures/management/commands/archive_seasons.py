@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from fixtures.archive import archive_season, finished_seasons
+from fixtures.models import Season
+
+
+class Command(BaseCommand):
+    help = 'Moves fixtures and goals from finished seasons into the archive tables, keeping the live tables small.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--season', help='Archive only this season, e.g. "2024-2025".')
+        parser.add_argument('--dry-run', action='store_true', help='List the seasons that would be archived.')
+
+    def handle(self, *args, **options):
+        seasons = finished_seasons()
+        if options['season']:
+            seasons = seasons.filter(name=options['season'])
+            if not seasons.exists():
+                if Season.objects.filter(name=options['season']).exists():
+                    raise CommandError(f"Season {options['season']} is not finished or is already archived.")
+                raise CommandError(f"Season {options['season']} does not exist.")
+
+        if not seasons.exists():
+            self.stdout.write(self.style.WARNING("No finished seasons to archive."))
+            return
+
+        for season in seasons:
+            if options['dry_run']:
+                self.stdout.write(f"  - WOULD ARCHIVE: {season} ({season.fixtures.count()} fixtures)")
+                continue
+            fixture_count, goal_count = archive_season(season)
+            self.stdout.write(f"  - ARCHIVED: {season} ({fixture_count} fixtures, {goal_count} goals)")
+
+        self.stdout.write(self.style.SUCCESS("✅ Archive complete!"))
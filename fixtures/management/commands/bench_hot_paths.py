@@ -0,0 +1,117 @@
+import statistics
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth.models import Permission, User
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.urls import reverse
+from django.utils import timezone
+
+from fixtures.archive import archive_season
+from fixtures.models import Season, Division, Team, Fixture, Player, Goal, ArchivedFixture
+
+
+# -----------------------------
+# Seeding helpers
+# -----------------------------
+
+def seed_season(start_year: int, weekends: int, teams: list, divisions: list, players: list) -> Season:
+    """Fill one season with a fixture per team pair per weekend, plus a goal each side."""
+    season = Season.for_date(date(start_year, 9, 1))
+    first_saturday = date(start_year, 9, 20)
+    fixtures = []
+    for week in range(weekends):
+        match_date = first_saturday + timedelta(weeks=week)
+        for i in range(0, len(teams), 2):
+            fixtures.append(Fixture(
+                season=season, division=divisions[i // 2 % len(divisions)],
+                home_team=teams[i], away_team=teams[i + 1], match_date=match_date,
+                home_score=2, away_score=1, decision=Fixture.Decision.PLAYED,
+            ))
+    fixtures = Fixture.all_seasons.bulk_create(fixtures, batch_size=500)
+    Goal.all_seasons.bulk_create([
+        Goal(fixture=fixture, player=player, quantity=1)
+        for fixture in fixtures for player in players[:2]
+    ], batch_size=500)
+    return season
+
+
+def time_view(client: Client, url: str, runs: int) -> tuple[float, int]:
+    """Median latency in ms and the number of queries for one GET of url."""
+    client.get(url)  # warm up templates and caches
+    # CaptureQueriesContext loses queries when the request resets the log, so count them directly
+    queries = []
+    with connection.execute_wrapper(lambda execute, sql, *rest: queries.append(sql) or execute(sql, *rest)):
+        client.get(url)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        client.get(url)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), len(queries)
+
+
+# -----------------------------
+# Django management command
+# -----------------------------
+
+class Command(BaseCommand):
+    help = ('Benchmarks the fixture list, TV display and scorer editing views as archived seasons accumulate. '
+            'Runs against a throwaway test database, never the real one.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seasons', type=int, default=20, help='How many past seasons to archive in total.')
+        parser.add_argument('--step', type=int, default=5, help='Measure after every N archived seasons.')
+        parser.add_argument('--weekends', type=int, default=25, help='Match weekends per season.')
+        parser.add_argument('--runs', type=int, default=30, help='Requests per measurement.')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            self.run_benchmark(options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+    def run_benchmark(self, options):
+        divisions = [Division.objects.create(name=f"Division {n}") for n in range(1, 7)]
+        teams = [Team.objects.create(name=f"Team {n}", division=divisions[n // 2 % 6]) for n in range(24)]
+        players = [Player.objects.create(full_name=f"Player {n}", gender=Player.Gender.FEMALE) for n in range(50)]
+
+        # The live season: just the current weekend, like the scraper leaves it
+        current_year = int(Season.current_name()[:4])
+        seed_season(current_year, 1, teams, divisions, players)
+        # seed_season dates it in September, so pin it to today to be sure it is in the current season
+        Fixture.all_seasons.update(match_date=timezone.localdate())
+        fixture_id = Fixture.objects.values_list('id', flat=True).first()
+
+        user = User.objects.create_user('bench')
+        user.user_permissions.add(Permission.objects.get(codename='change_fixture'))
+        client = Client()
+        client.force_login(user)
+        urls = {
+            'fixture_list': reverse('fixture_list'),
+            'tv_display': reverse('tv_display'),
+            'update_scorers': reverse('update_scorers', args=[fixture_id]),
+        }
+
+        self.stdout.write(f"{'archived':>8}  {'archive rows':>12}  " + "  ".join(f"{name:>22}" for name in urls))
+        archived = 0
+        while True:
+            rows = Fixture.all_seasons.count()
+            results = [time_view(client, url, options['runs']) for url in urls.values()]
+            archive_rows = ArchivedFixture.objects.count()
+            self.stdout.write(f"{archived:>8}  {archive_rows:>12}  " + "  ".join(
+                f"{ms:>9.2f} ms {queries:>3} queries" for ms, queries in results
+            ))
+            if archived >= options['seasons']:
+                break
+            for _ in range(options['step']):
+                archived += 1
+                season = seed_season(current_year - archived, options['weekends'], teams, divisions, players)
+                archive_season(season)
+            assert Fixture.all_seasons.count() == rows, "archiving should leave the live tables the same size"
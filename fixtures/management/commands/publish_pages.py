@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from fixtures.publish import publish_static_pages
+
+
+class Command(BaseCommand):
+    help = 'Prerenders the fixture list, TV display and fixtures.json to static files for the front web server.'
+
+    def handle(self, *args, **options):
+        for path in publish_static_pages():
+            self.stdout.write(f"  - WROTE: {path}")
+        self.stdout.write(self.style.SUCCESS("✅ Pages published."))
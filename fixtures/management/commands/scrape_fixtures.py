@@ -1,6 +1,7 @@
 import time
 from datetime import datetime, timedelta
 
+from django.conf import settings
 from django.core.management.base import BaseCommand
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -10,7 +11,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 
-from fixtures.models import Division, Team, Fixture
+from fixtures.models import Season, Division, Team, Fixture
+from fixtures.publish import publish_static_pages, publishing_paused
 
 
 # -----------------------------
@@ -232,46 +234,57 @@ class Command(BaseCommand):
         self.stdout.write("Preloading league tables once...")
         positions_cache = preload_league_positions(service)
 
-        # 3) Replace weekend fixtures for those dates
-        self.stdout.write("Clearing old fixtures for the upcoming weekend...")
-        Fixture.objects.filter(match_date__in=[d.date() for d in weekend_dates]).delete()
-
-        # 4) Save fixtures with cached positions
-        self.stdout.write(f"Saving {len(all_weekend_fixtures)} fixtures...")
-        created_count = 0
-
-        for fx in all_weekend_fixtures:
-            division_obj, _ = Division.objects.get_or_create(name=fx['division'])
-
-            home_team, _ = Team.objects.update_or_create(
-                name=normalize_team_name(fx['home_team']),
-                defaults={'badge_url': fx['home_team_badge_url']}
-            )
-            away_team, _ = Team.objects.update_or_create(
-                name=normalize_team_name(fx['away_team']),
-                defaults={'badge_url': fx['away_team_badge_url']}
-            )
-
-            positions = positions_cache.get(fx['division'], {})
-            home_pos = positions.get(normalize_team_name(fx['home_team']), 'N/A')
-            away_pos = positions.get(normalize_team_name(fx['away_team']), 'N/A')
-
-            h_score = int(fx['home_score']) if fx['home_score'].isdigit() else None
-            a_score = int(fx['away_score']) if fx['away_score'].isdigit() else None
-
-            Fixture.objects.create(
-                home_team=home_team,
-                away_team=away_team,
-                match_date=fx['match_date'],
-                division=division_obj,
-                home_score=h_score,
-                away_score=a_score,
-                home_league_pos=home_pos,
-                away_league_pos=away_pos,
-                decision=fx['decision'],
-            )
-            created_count += 1
-            self.stdout.write(f"  - CREATED: {fx['home_team']} vs {fx['away_team']}")
+        # Steps 3-4 save many rows; publish once at step 5 instead of after every one
+        with publishing_paused():
+            # 3) Replace weekend fixtures for those dates
+            self.stdout.write("Clearing old fixtures for the upcoming weekend...")
+            Fixture.all_seasons.filter(match_date__in=[d.date() for d in weekend_dates]).delete()
+            # Look each weekend day's season up once rather than per fixture
+            seasons = {d.date(): Season.for_date(d.date()) for d in weekend_dates}
+
+            # 4) Save fixtures with cached positions
+            self.stdout.write(f"Saving {len(all_weekend_fixtures)} fixtures...")
+            created_count = 0
+
+            for fx in all_weekend_fixtures:
+                division_obj, _ = Division.objects.get_or_create(name=fx['division'])
+
+                home_team, _ = Team.objects.update_or_create(
+                    name=normalize_team_name(fx['home_team']),
+                    defaults={'badge_url': fx['home_team_badge_url']}
+                )
+                away_team, _ = Team.objects.update_or_create(
+                    name=normalize_team_name(fx['away_team']),
+                    defaults={'badge_url': fx['away_team_badge_url']}
+                )
+
+                positions = positions_cache.get(fx['division'], {})
+                home_pos = positions.get(normalize_team_name(fx['home_team']), 'N/A')
+                away_pos = positions.get(normalize_team_name(fx['away_team']), 'N/A')
+
+                h_score = int(fx['home_score']) if fx['home_score'].isdigit() else None
+                a_score = int(fx['away_score']) if fx['away_score'].isdigit() else None
+
+                Fixture.objects.create(
+                    home_team=home_team,
+                    away_team=away_team,
+                    match_date=fx['match_date'],
+                    season=seasons[fx['match_date']],
+                    division=division_obj,
+                    home_score=h_score,
+                    away_score=a_score,
+                    home_league_pos=home_pos,
+                    away_league_pos=away_pos,
+                    decision=fx['decision'],
+                )
+                created_count += 1
+                self.stdout.write(f"  - CREATED: {fx['home_team']} vs {fx['away_team']}")
+
+        # 5) Publish static copies of the public pages for the front web server
+        if settings.FIXTURES_PRERENDER:
+            self.stdout.write("Publishing prerendered pages...")
+            for path in publish_static_pages():
+                self.stdout.write(f"  - WROTE: {path}")
 
         elapsed = time.time() - start_time
         self.stdout.write(self.style.SUCCESS(f"✅ Scrape complete! Created {created_count} fixtures in {elapsed:.2f}s."))
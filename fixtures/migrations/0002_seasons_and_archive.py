@@ -0,0 +1,106 @@
+# Generated by Django 5.2.5 on 2026-10-19 00:20
+
+import datetime
+
+import django.db.models.deletion
+import django.db.models.manager
+from django.db import migrations, models
+
+
+def assign_seasons(apps, schema_editor):
+    # Same rule as fixtures.models.season_bounds: seasons run August to July
+    Season = apps.get_model('fixtures', 'Season')
+    Fixture = apps.get_model('fixtures', 'Fixture')
+    for fixture in Fixture.all_seasons.filter(season__isnull=True):
+        day = fixture.match_date
+        start_year = day.year if day.month >= 8 else day.year - 1
+        season, _ = Season.objects.get_or_create(
+            name=f"{start_year}-{start_year + 1}",
+            defaults={'start_date': datetime.date(start_year, 8, 1), 'end_date': datetime.date(start_year + 1, 7, 31)},
+        )
+        fixture.season = season
+        fixture.save(update_fields=['season'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fixtures', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Season',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=20, unique=True)),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField()),
+                ('archived', models.BooleanField(default=False)),
+            ],
+            options={
+                'ordering': ['-start_date'],
+            },
+        ),
+        migrations.AlterModelOptions(
+            name='fixture',
+            options={'default_manager_name': 'all_seasons', 'ordering': ['match_date', 'division__name']},
+        ),
+        migrations.AlterModelOptions(
+            name='goal',
+            options={'default_manager_name': 'all_seasons'},
+        ),
+        migrations.AlterModelManagers(
+            name='fixture',
+            managers=[
+                ('all_seasons', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='goal',
+            managers=[
+                ('all_seasons', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedFixture',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('division_name', models.CharField(max_length=200)),
+                ('home_team_name', models.CharField(max_length=200)),
+                ('away_team_name', models.CharField(max_length=200)),
+                ('match_date', models.DateField()),
+                ('home_score', models.IntegerField(blank=True, null=True)),
+                ('away_score', models.IntegerField(blank=True, null=True)),
+                ('decision', models.CharField(choices=[('Scheduled', 'Scheduled'), ('Played', 'Played'), ('Walkover', 'Walkover'), ('Postponed', 'Postponed'), ('Bye', 'Bye')], max_length=20)),
+                ('scorers_text', models.TextField(blank=True, null=True)),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='archived_fixtures', to='fixtures.season')),
+            ],
+            options={
+                'ordering': ['match_date', 'division_name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='fixture',
+            name='season',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='fixtures', to='fixtures.season'),
+        ),
+        migrations.CreateModel(
+            name='ArchivedGoal',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quantity', models.PositiveIntegerField(default=1)),
+                ('fixture', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='goals', to='fixtures.archivedfixture')),
+                ('player', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_goals', to='fixtures.player')),
+            ],
+            options={
+                'unique_together': {('player', 'fixture')},
+            },
+        ),
+        migrations.RunPython(assign_seasons, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='fixture',
+            name='season',
+            field=models.ForeignKey(blank=True, editable=False, on_delete=django.db.models.deletion.PROTECT, related_name='fixtures', to='fixtures.season'),
+        ),
+    ]
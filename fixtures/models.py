@@ -1,4 +1,47 @@
+from datetime import date
+
+from django.core.exceptions import ValidationError
 from django.db import models
+from django.utils import timezone
+
+
+def season_bounds(day: date) -> tuple[str, date, date]:
+    """Hockey seasons run August to July, e.g. 20 Sep 2025 is in "2025-2026"."""
+    start_year = day.year if day.month >= 8 else day.year - 1
+    return f"{start_year}-{start_year + 1}", date(start_year, 8, 1), date(start_year + 1, 7, 31)
+
+
+class Season(models.Model):
+    name = models.CharField(max_length=20, unique=True)
+    start_date = models.DateField()
+    end_date = models.DateField()
+    # Set by the archive_seasons command once fixtures and goals have moved to the archive tables
+    archived = models.BooleanField(default=False)
+    class Meta:
+        ordering = ['-start_date']
+    def __str__(self):
+        return self.name
+
+    @classmethod
+    def for_date(cls, day: date) -> 'Season':
+        name, start_date, end_date = season_bounds(day)
+        season, _ = cls.objects.get_or_create(name=name, defaults={'start_date': start_date, 'end_date': end_date})
+        return season
+
+    @classmethod
+    def current_name(cls) -> str:
+        return season_bounds(timezone.localdate())[0]
+
+
+class CurrentSeasonFixtureManager(models.Manager):
+    """Only fixtures from the season we are in now - what every public page shows."""
+    def get_queryset(self):
+        return super().get_queryset().filter(season__name=Season.current_name())
+
+
+class CurrentSeasonGoalManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().filter(fixture__season__name=Season.current_name())
 
 class Division(models.Model):
     name = models.CharField(max_length=200, unique=True)
@@ -24,6 +67,8 @@ class Fixture(models.Model):
         WALKOVER = 'Walkover'
         POSTPONED = 'Postponed'
         BYE = 'Bye'
+    # Derived from match_date in clean()/save(), never picked by hand
+    season = models.ForeignKey(Season, on_delete=models.PROTECT, related_name='fixtures', blank=True, editable=False)
     division = models.ForeignKey(Division, on_delete=models.CASCADE, related_name='fixtures')
     home_team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name='home_fixtures')
     away_team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name='away_fixtures')
@@ -34,11 +79,37 @@ class Fixture(models.Model):
     away_league_pos = models.CharField(max_length=10, blank=True, null=True)
     decision = models.CharField(max_length=20, choices=Decision.choices, default=Decision.SCHEDULED)
     scorers_text = models.TextField(blank=True, null=True)
+
+    # Fixture.objects is scoped to the current season; all_seasons sees everything and is
+    # what the admin, related lookups and get_object_or_404 use.
+    objects = CurrentSeasonFixtureManager()
+    all_seasons = models.Manager()
+
     class Meta:
         ordering = ['match_date', 'division__name']
         unique_together = ('home_team', 'away_team', 'match_date')
+        default_manager_name = 'all_seasons'
     def __str__(self):
         return f"{self.home_team} vs {self.away_team} on {self.match_date}"
+    def assign_season(self):
+        # Always follow match_date, so a fixture moved across 1 August changes season.
+        # Reuse the loaded season when it still matches to save a query on every save.
+        name = season_bounds(self.match_date)[0]
+        if not (Fixture.season.is_cached(self) and self.season.name == name):
+            self.season = Season.for_date(self.match_date)
+        # Archived seasons live only in the archive tables; a live row here would be
+        # missed by the stats, which read the archive for those seasons
+        if self.season.archived:
+            raise ValidationError({'match_date': f"Season {self.season} has been archived, so it can't take new fixtures."})
+    def clean(self):
+        if self.match_date is not None:
+            self.assign_season()
+    def save(self, *args, **kwargs):
+        self.assign_season()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'match_date' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'season'}
+        super().save(*args, **kwargs)
 
 class Player(models.Model):
     class Gender(models.TextChoices):
@@ -55,6 +126,44 @@ class Goal(models.Model):
     player = models.ForeignKey(Player, on_delete=models.CASCADE, related_name='goals')
     fixture = models.ForeignKey(Fixture, on_delete=models.CASCADE, related_name='goals')
     quantity = models.PositiveIntegerField(default=1)
+
+    objects = CurrentSeasonGoalManager()
+    all_seasons = models.Manager()
+
+    class Meta:
+        unique_together = ('player', 'fixture')
+        default_manager_name = 'all_seasons'
+    def __str__(self):
+        return f"{self.player.full_name} ({self.quantity}) in {self.fixture}"
+
+
+# -----------------------------
+# Archive tables for finished seasons
+# -----------------------------
+# Flattened copies of Fixture/Goal so the hot tables only hold live seasons.
+# Team and division names are stored as text because clubs rename and move divisions.
+
+class ArchivedFixture(models.Model):
+    # PROTECT: once a season is archived these rows are the only copy of it
+    season = models.ForeignKey(Season, on_delete=models.PROTECT, related_name='archived_fixtures')
+    division_name = models.CharField(max_length=200)
+    home_team_name = models.CharField(max_length=200)
+    away_team_name = models.CharField(max_length=200)
+    match_date = models.DateField()
+    home_score = models.IntegerField(null=True, blank=True)
+    away_score = models.IntegerField(null=True, blank=True)
+    decision = models.CharField(max_length=20, choices=Fixture.Decision.choices)
+    scorers_text = models.TextField(blank=True, null=True)
+    class Meta:
+        ordering = ['match_date', 'division_name']
+    def __str__(self):
+        return f"{self.home_team_name} vs {self.away_team_name} on {self.match_date}"
+
+
+class ArchivedGoal(models.Model):
+    player = models.ForeignKey(Player, on_delete=models.CASCADE, related_name='archived_goals')
+    fixture = models.ForeignKey(ArchivedFixture, on_delete=models.CASCADE, related_name='goals')
+    quantity = models.PositiveIntegerField(default=1)
     class Meta:
         unique_together = ('player', 'fixture')
     def __str__(self):
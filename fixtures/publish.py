@@ -0,0 +1,184 @@
+import gzip
+import json
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+
+from .models import Fixture
+
+try:
+    import brotli
+except ImportError:  # Brotli is in requirements.txt; without it we fall back to gzip only
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Set while a bulk job (e.g. the scraper) saves many rows and publishes once at the end
+_publishing_paused = ContextVar('publishing_paused', default=False)
+
+
+# -----------------------------
+# Page contexts (shared by the views and the publisher)
+# -----------------------------
+
+def display_fixtures():
+    """Current-season fixtures in display order, with the related rows the templates touch."""
+    return Fixture.objects.select_related('division', 'home_team', 'away_team').order_by('match_date', 'division__name')
+
+
+def fixture_list_context():
+    grouped_fixtures = {}
+    for fixture in display_fixtures():
+        grouped_fixtures.setdefault(fixture.division.name, []).append(fixture)
+    return {'grouped_fixtures': grouped_fixtures}
+
+
+def tv_display_context():
+    return {'flat_fixture_list': list(display_fixtures())}
+
+
+def fixture_data():
+    """Plain JSON-friendly version of the fixtures, for kiosks and other clients."""
+    return {
+        'fixtures': [
+            {
+                'id': fixture.id,
+                'division': fixture.division.name,
+                'match_date': fixture.match_date,
+                'home_team': fixture.home_team.name,
+                'home_team_badge_url': fixture.home_team.badge_url,
+                'home_score': fixture.home_score,
+                'home_league_pos': fixture.home_league_pos,
+                'away_team': fixture.away_team.name,
+                'away_team_badge_url': fixture.away_team.badge_url,
+                'away_score': fixture.away_score,
+                'away_league_pos': fixture.away_league_pos,
+                'decision': fixture.decision,
+                'scorers_text': fixture.scorers_text,
+            }
+            for fixture in display_fixtures()
+        ]
+    }
+
+
+def render_fixture_data():
+    return json.dumps(fixture_data(), cls=DjangoJSONEncoder)
+
+
+# -----------------------------
+# Static publishing
+# -----------------------------
+
+# File name on disk -> content type, for every page we prerender
+PAGES = {
+    'index.html': 'text/html; charset=utf-8',
+    'tv/index.html': 'text/html; charset=utf-8',
+    'fixtures.json': 'application/json',
+}
+
+
+def write_atomic(path: Path, content: bytes):
+    """Write to a temp file in the same directory, then rename over the target,
+    so the web server never sees a half-written file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            tmp.write(content)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+# Brotli quality 11 is ~15x slower than 5 for a few percent smaller files. Use the
+# best quality for scrapes and manual publishes, and a fast one inside requests.
+BROTLI_QUALITY_BEST = 11
+BROTLI_QUALITY_FAST = 5
+
+
+def write_with_variants(path: Path, content: bytes, brotli_quality: int = BROTLI_QUALITY_BEST):
+    """Write the file plus precompressed .gz (and .br when available) siblings."""
+    write_atomic(path, content)
+    # mtime=0 keeps the gzip output identical between runs with the same content
+    write_atomic(path.with_name(path.name + '.gz'), gzip.compress(content, compresslevel=9, mtime=0))
+    br_path = path.with_name(path.name + '.br')
+    if brotli is not None:
+        write_atomic(br_path, brotli.compress(content, quality=brotli_quality))
+    else:
+        # Don't leave an old .br behind for brotli_static to keep serving
+        br_path.unlink(missing_ok=True)
+
+
+def render_pages() -> dict:
+    """Render every published page to bytes, keyed by its file name on disk."""
+    return {
+        'index.html': render_to_string('fixtures/fixture_list.html', fixture_list_context()).encode('utf-8'),
+        'tv/index.html': render_to_string('fixtures/tv_display.html', tv_display_context()).encode('utf-8'),
+        'fixtures.json': render_fixture_data().encode('utf-8'),
+    }
+
+
+def publish_static_pages(brotli_quality: int = BROTLI_QUALITY_BEST) -> list[Path]:
+    """Prerender the fixture pages and their JSON data into FIXTURES_PRERENDER_ROOT."""
+    root = Path(settings.FIXTURES_PRERENDER_ROOT)
+    written = []
+    for name, content in render_pages().items():
+        path = root / name
+        write_with_variants(path, content, brotli_quality)
+        written.append(path)
+    return written
+
+
+def publish_if_enabled():
+    """Republish only when the site is configured to serve prerendered pages.
+
+    Disk errors are logged rather than raised: the edit that triggered the publish
+    has already been saved, and the next publish will catch the pages up. This runs
+    inside the request that made the edit, so it uses the fast Brotli quality."""
+    if not settings.FIXTURES_PRERENDER:
+        return []
+    try:
+        return publish_static_pages(brotli_quality=BROTLI_QUALITY_FAST)
+    except OSError:
+        logger.exception("Could not publish prerendered pages to %s", settings.FIXTURES_PRERENDER_ROOT)
+        return []
+
+
+def is_publishing_paused() -> bool:
+    return _publishing_paused.get()
+
+
+@contextmanager
+def publishing_paused():
+    """Skip the automatic publish on every Fixture/Goal change inside this block."""
+    token = _publishing_paused.set(True)
+    try:
+        yield
+    finally:
+        _publishing_paused.reset(token)
+
+
+def prerendered_response(request, name: str):
+    """Serve a published file through Django, or None if we should render dynamically.
+
+    Normally the front web server serves these files directly; this is the fallback
+    for requests that still reach Django while prerendering is switched on. Logged-in
+    users always get the dynamic page so they keep their "Edit Scorers" links."""
+    if not settings.FIXTURES_PRERENDER or request.user.is_authenticated:
+        return None
+    path = Path(settings.FIXTURES_PRERENDER_ROOT) / name
+    try:
+        content = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    return HttpResponse(content, content_type=PAGES[name])
@@ -0,0 +1,25 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Fixture, Goal
+from .publish import is_publishing_paused, publish_if_enabled
+
+
+# Scores, scorers and goals all show on the public pages, so republish whenever they
+# change - from the scorer page, the admin or anywhere else. on_commit makes sure we
+# render what was actually saved, and never publish a change that got rolled back.
+# A scorer click or an admin save with goal inlines changes several rows in one
+# transaction, so only one publish is queued per transaction.
+@receiver(post_save, sender=Fixture)
+@receiver(post_delete, sender=Fixture)
+@receiver(post_save, sender=Goal)
+@receiver(post_delete, sender=Goal)
+def republish_on_change(sender, using, **kwargs):
+    if is_publishing_paused():
+        return
+    connection = transaction.get_connection(using)
+    # Pending callbacks are dropped on rollback, so this can't get stuck "already queued"
+    if any(callback[1] is publish_if_enabled for callback in connection.run_on_commit):
+        return
+    transaction.on_commit(publish_if_enabled, using=using)
@@ -0,0 +1,24 @@
+from collections import Counter
+
+from django.db.models import Sum
+
+from .models import Goal, ArchivedGoal
+
+
+def player_goal_totals(season=None) -> list[tuple[str, int]]:
+    """[(player name, goals), ...] for one season, or all time when season is None.
+
+    Reads the archive tables for archived seasons and the live tables otherwise,
+    so stats look the same before and after archive_seasons has run."""
+    if season is None:
+        sources = [Goal.all_seasons.all(), ArchivedGoal.objects.all()]
+    elif season.archived:
+        sources = [ArchivedGoal.objects.filter(fixture__season=season)]
+    else:
+        sources = [Goal.all_seasons.filter(fixture__season=season)]
+
+    totals = Counter()
+    for goals in sources:
+        for row in goals.values('player__full_name').annotate(total=Sum('quantity')):
+            totals[row['player__full_name']] += row['total']
+    return sorted(totals.items(), key=lambda item: (-item[1], item[0]))
@@ -1,3 +1,251 @@
-from django.test import TestCase
+import gzip
+import json
+import tempfile
+from io import StringIO
+from datetime import date
+from pathlib import Path
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.contrib.auth.models import Permission, User
+from django.core.management import call_command
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import ProtectedError
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from . import publish
+from .archive import archive_season
+from .models import Season, Division, Team, Fixture, Player, Goal, ArchivedFixture, ArchivedGoal
+from .publish import publish_static_pages, fixture_list_context, tv_display_context
+from .stats import player_goal_totals
+
+
+class PrerenderTestMixin:
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+        division = Division.objects.create(name="South East Women's Division 1 East")
+        home = Team.objects.create(name='Burnt Ash Ladies 1', badge_url='https://example.com/home.png')
+        away = Team.objects.create(name='Canterbury Ladies 2', badge_url='https://example.com/away.png')
+        self.fixture = Fixture.objects.create(
+            division=division, home_team=home, away_team=away, match_date=timezone.localdate(),
+            home_score=3, away_score=1, home_league_pos='1st', away_league_pos='4th',
+            decision=Fixture.Decision.PLAYED, scorers_text='Jane Doe (2), Sam Smith (1)',
+        )
+
+    def published(self, name):
+        return (self.root / name).read_bytes()
+
+
+class PrerenderTests(PrerenderTestMixin, TestCase):
+    def test_prerendered_pages_match_dynamic_views(self):
+        with override_settings(FIXTURES_PRERENDER=False, FIXTURES_PRERENDER_ROOT=self.root):
+            publish_static_pages()
+            for url_name, file_name in [('fixture_list', 'index.html'), ('tv_display', 'tv/index.html'), ('fixture_data', 'fixtures.json')]:
+                with self.subTest(url_name):
+                    response = self.client.get(reverse(url_name))
+                    self.assertEqual(response.content, self.published(file_name))
+
+    def test_publish_writes_gzip_variants(self):
+        with override_settings(FIXTURES_PRERENDER_ROOT=self.root):
+            publish_static_pages()
+        for name in ['index.html', 'tv/index.html', 'fixtures.json']:
+            self.assertEqual(gzip.decompress(self.published(name + '.gz')), self.published(name))
+        self.assertEqual(list(self.root.rglob('*.tmp')), [])
+        data = json.loads(self.published('fixtures.json'))
+        self.assertEqual(data['fixtures'][0]['home_team'], 'Burnt Ash Ladies 1')
+
+    def test_prerender_setting_serves_published_file(self):
+        with override_settings(FIXTURES_PRERENDER=True, FIXTURES_PRERENDER_ROOT=self.root):
+            (self.root / 'index.html').write_bytes(b'published copy')
+            self.assertEqual(self.client.get(reverse('fixture_list')).content, b'published copy')
+            # Nothing published yet for the TV page, so it falls back to rendering
+            self.assertContains(self.client.get(reverse('tv_display')), 'Burnt Ash Ladies 1')
+
+    @skipUnless(publish.brotli, 'brotli is not installed')
+    def test_publish_writes_brotli_variants(self):
+        with override_settings(FIXTURES_PRERENDER_ROOT=self.root):
+            publish_static_pages()
+        for name in ['index.html', 'tv/index.html', 'fixtures.json']:
+            self.assertEqual(publish.brotli.decompress(self.published(name + '.br')), self.published(name))
+
+    def test_publish_without_brotli_removes_stale_variant(self):
+        (self.root / 'index.html.br').write_bytes(b'stale')
+        with override_settings(FIXTURES_PRERENDER_ROOT=self.root), mock.patch.object(publish, 'brotli', None):
+            publish_static_pages()
+        self.assertFalse((self.root / 'index.html.br').exists())
+        self.assertTrue((self.root / 'index.html.gz').exists())
+
+
+# Republishing waits for transaction.on_commit, so these need real commits
+class RepublishTests(PrerenderTestMixin, TransactionTestCase):
+    def test_goal_edit_republishes(self):
+        user = User.objects.create_user('scorer', password='pw')
+        user.user_permissions.add(Permission.objects.get(codename='change_fixture'))
+        self.client.force_login(user)
+        player = Player.objects.create(full_name='Alex Jones', gender=Player.Gender.FEMALE)
+        with override_settings(FIXTURES_PRERENDER=True, FIXTURES_PRERENDER_ROOT=self.root):
+            response = self.client.post(
+                reverse('add_or_update_goal', args=[self.fixture.id]),
+                data=json.dumps({'player_id': player.id, 'quantity': 2}),
+                content_type='application/json',
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'Alex Jones (2)', self.published('index.html'))
+        self.assertIn(b'Alex Jones (2)', self.published('tv/index.html'))
+
+    def test_goal_edit_publishes_once(self):
+        user = User.objects.create_user('scorer', password='pw')
+        user.user_permissions.add(Permission.objects.get(codename='change_fixture'))
+        self.client.force_login(user)
+        player = Player.objects.create(full_name='Alex Jones', gender=Player.Gender.FEMALE)
+        with override_settings(FIXTURES_PRERENDER=True, FIXTURES_PRERENDER_ROOT=self.root), \
+                mock.patch.object(publish, 'publish_static_pages', wraps=publish.publish_static_pages) as publish_pages:
+            # Saves a Goal and then the Fixture's scorers_text
+            self.client.post(
+                reverse('add_or_update_goal', args=[self.fixture.id]),
+                data=json.dumps({'player_id': player.id, 'quantity': 1}),
+                content_type='application/json',
+            )
+        publish_pages.assert_called_once_with(brotli_quality=publish.BROTLI_QUALITY_FAST)
+
+    def test_fixture_change_outside_scorer_page_republishes(self):
+        # e.g. a score corrected in the admin
+        with override_settings(FIXTURES_PRERENDER=True, FIXTURES_PRERENDER_ROOT=self.root):
+            self.fixture.home_score = 7
+            self.fixture.save()
+        self.assertEqual(json.loads(self.published('fixtures.json'))['fixtures'][0]['home_score'], 7)
+
+    def test_publish_failure_does_not_fail_goal_edit(self):
+        user = User.objects.create_user('scorer', password='pw')
+        user.user_permissions.add(Permission.objects.get(codename='change_fixture'))
+        self.client.force_login(user)
+        player = Player.objects.create(full_name='Alex Jones', gender=Player.Gender.FEMALE)
+        # A file where the directory should be, so every write fails
+        not_a_dir = self.root / 'not-a-dir'
+        not_a_dir.write_text('')
+        with override_settings(FIXTURES_PRERENDER=True, FIXTURES_PRERENDER_ROOT=not_a_dir):
+            with self.assertLogs('fixtures.publish', level='ERROR'):
+                response = self.client.post(
+                    reverse('add_or_update_goal', args=[self.fixture.id]),
+                    data=json.dumps({'player_id': player.id, 'quantity': 1}),
+                    content_type='application/json',
+                )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Goal.all_seasons.get().quantity, 1)
+
+
+def years_ago(years):
+    # First of the month, so this never lands on a 29 February that does not exist
+    today = timezone.localdate()
+    return date(today.year - years, today.month, 1)
+
+
+class SeasonTests(TestCase):
+    def setUp(self):
+        self.division = Division.objects.create(name='Division 1')
+        self.home = Team.objects.create(name='Burnt Ash Men 1')
+        self.away = Team.objects.create(name='Sevenoaks Men 2')
+        self.player = Player.objects.create(full_name='Sam Smith', gender=Player.Gender.MALE)
+
+    def add_fixture(self, match_date, goals=0):
+        fixture = Fixture.objects.create(
+            division=self.division, home_team=self.home, away_team=self.away, match_date=match_date,
+            home_score=goals, away_score=0, decision=Fixture.Decision.PLAYED,
+        )
+        if goals:
+            Goal.objects.create(fixture=fixture, player=self.player, quantity=goals)
+        return fixture
+
+    def test_fixture_is_assigned_to_season_by_date(self):
+        self.assertEqual(self.add_fixture(date(2025, 9, 20)).season.name, '2025-2026')
+        self.assertEqual(self.add_fixture(date(2026, 5, 2)).season.name, '2025-2026')
+        self.assertEqual(self.add_fixture(date(2026, 8, 29)).season.name, '2026-2027')
+        self.assertEqual(Season.objects.count(), 2)
+
+    def test_moving_fixture_across_season_boundary_changes_season(self):
+        fixture = self.add_fixture(date(2025, 7, 31))
+        self.assertEqual(fixture.season.name, '2024-2025')
+        fixture.match_date = date(2025, 8, 2)
+        fixture.save()
+        fixture.refresh_from_db()
+        self.assertEqual(fixture.season.name, '2025-2026')
+
+    def test_moving_fixture_into_archived_season_is_refused(self):
+        old_date = years_ago(2)
+        self.add_fixture(old_date)
+        archive_season(Season.for_date(old_date))
+        fixture = self.add_fixture(timezone.localdate())
+        fixture.match_date = old_date
+        with self.assertRaises(ValidationError):
+            fixture.save()
+
+    def test_default_querysets_only_see_current_season(self):
+        current = self.add_fixture(timezone.localdate(), goals=1)
+        self.add_fixture(years_ago(2), goals=2)
+        self.assertEqual(list(Fixture.objects.all()), [current])
+        self.assertEqual(Fixture.all_seasons.count(), 2)
+        self.assertEqual(Goal.objects.count(), 1)
+        self.assertEqual(Goal.all_seasons.count(), 2)
+
+    def test_archive_moves_season_and_keeps_stats(self):
+        old_date = years_ago(2)
+        self.add_fixture(old_date, goals=3)
+        season = Season.for_date(old_date)
+        before = player_goal_totals(season)
+
+        self.assertEqual(archive_season(season), (1, 1))
+
+        season.refresh_from_db()
+        self.assertTrue(season.archived)
+        self.assertEqual(Fixture.all_seasons.count(), 0)
+        self.assertEqual(Goal.all_seasons.count(), 0)
+        archived = ArchivedFixture.objects.get()
+        self.assertEqual((archived.home_team_name, archived.away_team_name, archived.home_score), ('Burnt Ash Men 1', 'Sevenoaks Men 2', 3))
+        self.assertEqual(ArchivedGoal.objects.get().quantity, 3)
+        self.assertEqual(player_goal_totals(season), before)
+        self.assertEqual(player_goal_totals(), [('Sam Smith', 3)])
+
+    def test_archived_season_refuses_new_fixtures(self):
+        old_date = years_ago(2)
+        self.add_fixture(old_date, goals=1)
+        archive_season(Season.for_date(old_date))
+        with self.assertRaises(ValidationError):
+            self.add_fixture(old_date)
+        self.assertEqual(Fixture.all_seasons.count(), 0)
+
+    def test_archived_season_cannot_be_deleted(self):
+        old_date = years_ago(2)
+        self.add_fixture(old_date)
+        season = Season.for_date(old_date)
+        archive_season(season)
+        with self.assertRaises(ProtectedError):
+            season.delete()
+        self.assertEqual(ArchivedFixture.objects.count(), 1)
+
+    def test_archive_command_skips_current_season(self):
+        self.add_fixture(timezone.localdate())
+        self.add_fixture(years_ago(1))
+        call_command('archive_seasons', stdout=StringIO())
+        self.assertEqual(Fixture.all_seasons.get().season.name, Season.current_name())
+        self.assertEqual(ArchivedFixture.objects.count(), 1)
+
+    def test_hot_path_queries_do_not_grow_with_archive(self):
+        self.add_fixture(timezone.localdate(), goals=1)
+        with CaptureQueriesContext(connection) as empty_archive:
+            fixture_list_context()
+            tv_display_context()
+        for years_back in range(1, 4):
+            old_date = years_ago(years_back)
+            self.add_fixture(old_date, goals=1)
+            archive_season(Season.for_date(old_date))
+        with CaptureQueriesContext(connection) as full_archive:
+            fixture_list_context()
+            tv_display_context()
+        self.assertEqual(len(full_archive), len(empty_archive))
+        self.assertFalse(any('archived' in query['sql'] for query in full_archive))
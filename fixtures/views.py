@@ -1,30 +1,35 @@
 import json
 from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.decorators import login_required, permission_required
-from django.http import JsonResponse
+from django.db import transaction
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.http import require_POST
-from .models import Fixture, Player, Goal
+from .models import Fixture, Player
+from .publish import (
+    fixture_list_context, tv_display_context, render_fixture_data,
+    prerendered_response,
+)
 
 
-# This function is correct and needs no changes
 def fixture_list(request):
-    all_fixtures = Fixture.objects.order_by('match_date', 'division__name').all()
-    grouped_fixtures = {}
-    for fixture in all_fixtures:
-        division_name = fixture.division.name
-        if division_name not in grouped_fixtures:
-            grouped_fixtures[division_name] = []
-        grouped_fixtures[division_name].append(fixture)
-    context = {'grouped_fixtures': grouped_fixtures}
-    return render(request, 'fixtures/fixture_list.html', context)
-
-
-# This function is correct and needs no changes
+    prerendered = prerendered_response(request, 'index.html')
+    if prerendered is not None:
+        return prerendered
+    return render(request, 'fixtures/fixture_list.html', fixture_list_context())
+
+
 def tv_display_view(request):
-    all_fixtures = Fixture.objects.order_by('match_date', 'division__name').all()
-    flat_fixture_list = list(all_fixtures)
-    context = {'flat_fixture_list': flat_fixture_list}
-    return render(request, 'fixtures/tv_display.html', context)
+    prerendered = prerendered_response(request, 'tv/index.html')
+    if prerendered is not None:
+        return prerendered
+    return render(request, 'fixtures/tv_display.html', tv_display_context())
+
+
+def fixture_data_view(request):
+    prerendered = prerendered_response(request, 'fixtures.json')
+    if prerendered is not None:
+        return prerendered
+    return HttpResponse(render_fixture_data(), content_type='application/json')
 
 
 # --- NEW SCORER VIEWS ---
@@ -36,7 +41,7 @@ def update_scorers(request, fixture_id):
     all_players = list(Player.objects.values('id', 'full_name'))  # Keep it simple for JSON
 
     # Pass the existing goals in a clear list format for the new JS
-    existing_goals = list(Goal.objects.filter(fixture=fixture).values('player_id', 'quantity'))
+    existing_goals = list(fixture.goals.values('player_id', 'quantity'))
 
     context = {
         'fixture': fixture,
@@ -61,15 +66,17 @@ def add_or_update_goal(request, fixture_id):
     fixture = get_object_or_404(Fixture, id=fixture_id)
     player = get_object_or_404(Player, id=player_id)
 
-    if quantity > 0:
-        Goal.objects.update_or_create(fixture=fixture, player=player, defaults={'quantity': quantity})
-    else:
-        Goal.objects.filter(fixture=fixture, player=player).delete()
-
-    # Update the simple text field for other displays
-    goals = fixture.goals.select_related('player').order_by('player__full_name')
-    fixture.scorers_text = ", ".join([f"{g.player.full_name} ({g.quantity})" for g in goals])
-    fixture.save()
+    # One transaction, so the goal and scorers_text commit (and republish) together
+    with transaction.atomic():
+        if quantity > 0:
+            fixture.goals.update_or_create(player=player, defaults={'quantity': quantity})
+        else:
+            fixture.goals.filter(player=player).delete()
+
+        # Update the simple text field for other displays
+        goals = fixture.goals.select_related('player').order_by('player__full_name')
+        fixture.scorers_text = ", ".join([f"{g.player.full_name} ({g.quantity})" for g in goals])
+        fixture.save()
 
     return JsonResponse({'status': 'success'})
 
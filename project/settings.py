@@ -122,4 +122,22 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # test
 # test 2
 import os
-STATICFILES_DIRS = [os.path.join(BASE_DIR, 'static')]
\ No newline at end of file
+STATICFILES_DIRS = [os.path.join(BASE_DIR, 'static')]
+
+# Prerendered pages
+# When True, fixture_list, tv_display and fixtures.json are published as static
+# files (with .gz and .br variants; Brotli is in requirements.txt) after every scrape
+# and every Fixture/Goal change, and the front web server should serve them straight
+# from FIXTURES_PRERENDER_ROOT. Logged-in users (anyone with a sessionid cookie) must
+# still reach Django so they keep their "Edit Scorers" links, e.g. for nginx:
+#     location = / {
+#         root <FIXTURES_PRERENDER_ROOT>;
+#         gzip_static on;
+#         brotli_static on;
+#         error_page 418 = @django;
+#         if ($cookie_sessionid) { return 418; }
+#         try_files /index.html @django;
+#     }
+# and the same for /tv/ (tv/index.html) and /fixtures.json.
+FIXTURES_PRERENDER = False
+FIXTURES_PRERENDER_ROOT = BASE_DIR / 'prerendered'